@@ -0,0 +1,79 @@
+# ==============================================================================
+# BRVM API GATEWAY - CONFIGURATION ET CONNEXION À LA BASE DE DONNÉES
+# ==============================================================================
+
+from functools import lru_cache
+import asyncio
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+
+# --- Configuration de la Base de Données ---
+class Settings(BaseSettings):
+    # Lues depuis l'environnement, ou depuis un fichier .env pour un test local
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    DB_USER: str
+    DB_PASSWORD: str
+    DB_HOST: str
+    DB_PORT: int
+    DB_NAME: str
+
+    # Chaque worker uvicorn a son propre pool : WEB_CONCURRENCY x
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) ne doit pas dépasser DB_MAX_CONNECTIONS,
+    # la part du max_connections de Postgres (100 par défaut) réservée à l'API.
+    WEB_CONCURRENCY: int = 2
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_MAX_CONNECTIONS: int = 80
+
+    @model_validator(mode="after")
+    def check_connection_budget(self):
+        needed = self.WEB_CONCURRENCY * (self.DB_POOL_SIZE + self.DB_MAX_OVERFLOW)
+        if needed > self.DB_MAX_CONNECTIONS:
+            raise ValueError(
+                f"WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW) = {needed} "
+                f"dépasse DB_MAX_CONNECTIONS = {self.DB_MAX_CONNECTIONS}"
+            )
+        return self
+
+    @property
+    def database_url(self) -> str:
+        return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
+@lru_cache
+def get_settings() -> Settings:
+    # Une variable manquante lève une ValidationError au démarrage
+    return Settings()
+
+# --- Moteur de connexion ---
+def create_engine(settings: Settings) -> AsyncEngine:
+    # Créer le "moteur" de connexion à la base de données
+    # (un DSN invalide doit faire échouer le démarrage, pas la première requête)
+    return create_async_engine(
+        settings.database_url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=5,
+        # Requêtes identiques à chaque appel : asyncpg les garde préparées côté serveur
+        connect_args={"statement_cache_size": 1024, "prepared_statement_cache_size": 256},
+    )
+
+async def warm_up_pool(engine: AsyncEngine, size: int):
+    # Ouvrir les connexions au démarrage pour que les premières requêtes
+    # ne paient pas la poignée de main TCP/authentification Postgres.
+    # Une première connexion seule donne une erreur claire si la base est injoignable.
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    # Rendues au pool, elles y restent ouvertes ; celles qui ont pu s'ouvrir
+    # sont rendues même si d'autres ont échoué
+    await asyncio.gather(*(conn.close() for conn in results if not isinstance(conn, BaseException)))
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
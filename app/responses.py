@@ -0,0 +1,26 @@
+# ==============================================================================
+# BRVM API GATEWAY - SÉRIALISATION JSON
+# ==============================================================================
+
+from decimal import Decimal
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import RowMapping
+import orjson
+
+def _orjson_default(obj):
+    # Les colonnes NUMERIC arrivent en Decimal, qu'orjson ne sait pas encoder
+    if isinstance(obj, Decimal):
+        return float(obj)
+    # Lignes issues de result.mappings(), encodées telles quelles
+    if isinstance(obj, RowMapping):
+        return dict(obj)
+    raise TypeError
+
+def dumps(content) -> bytes:
+    return orjson.dumps(content, default=_orjson_default)
+
+class JSONResponse(ORJSONResponse):
+    """ORJSONResponse qui accepte aussi les Decimal renvoyés par Postgres."""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,100 @@
+# ==============================================================================
+# BRVM API GATEWAY - ANALYSE COMPLÈTE PAR SYMBOLE
+# ==============================================================================
+
+from fastapi import APIRouter, HTTPException, Path, Request
+from sqlalchemy import text
+
+from app.responses import JSONResponse
+from app.schemas import FullAnalysis
+
+router = APIRouter()
+
+# Symboles BRVM : quelques lettres/chiffres. Tout le reste est rejeté en 422
+# par FastAPI avant l'appel du handler, donc sans prendre de connexion au pool.
+SYMBOL_PATTERN = r"^[A-Za-z0-9]{2,10}$"
+
+# --- Requêtes SQL ---
+# Société, dernière séance avec ses signaux techniques, et analyses fondamentales.
+# Sert aussi à résoudre le symbole en company_id (aucune ligne => 404) : pour un
+# symbole inconnu, seul l'index sur companies.symbol est lu et les LATERAL ne
+# sont jamais exécutés (voir sql/002_companies_symbol_idx.sql).
+LATEST_ANALYSIS_SQL = text("""
+    SELECT 
+        c.id as company_id, c.symbol, c.name as company_name,
+        hd.trade_date, hd.price,
+        ta.mm_decision, ta.bollinger_decision, ta.macd_decision,
+        ta.rsi_decision, ta.stochastic_decision,
+        fa.fundamental_summaries
+    FROM companies c
+    LEFT JOIN LATERAL (
+        SELECT STRING_AGG(analysis_summary, E'\\n---\\n' ORDER BY report_date DESC) as fundamental_summaries
+        FROM fundamental_analysis
+        WHERE company_id = c.id
+    ) fa ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT id, trade_date, price
+        FROM historical_data
+        WHERE company_id = c.id
+        ORDER BY trade_date DESC
+        LIMIT 1
+    ) hd ON TRUE
+    LEFT JOIN technical_analysis ta ON hd.id = ta.historical_data_id
+    WHERE c.symbol = :symbol;
+""")
+
+# Les 50 derniers cours uniquement (date, prix) : parcours de l'index
+# (company_id, trade_date DESC), voir sql/001_historical_data_company_trade_date_idx.sql
+PRICE_HISTORY_SQL = text("""
+    SELECT trade_date as date, price
+    FROM (
+        SELECT trade_date, price
+        FROM historical_data
+        WHERE company_id = :company_id
+        ORDER BY trade_date DESC
+        LIMIT 50
+    ) hd
+    WHERE trade_date IS NOT NULL AND price IS NOT NULL
+    ORDER BY trade_date ASC;
+""")
+
+@router.get("/analysis/{symbol}", response_model=FullAnalysis)
+async def get_full_analysis(
+    request: Request,
+    symbol: str = Path(pattern=SYMBOL_PATTERN)
+):
+    """
+    Retourne la dernière analyse complète (cours, technique, fondamentale)
+    et l'historique des 50 derniers jours pour un symbole donné.
+    """
+    symbol = symbol.upper()
+    
+    # La connexion est ouverte ici, après validation du symbole (une dépendance
+    # serait résolue avant la validation des paramètres de chemin).
+    async with request.app.state.engine.connect() as conn:
+        # Une connexion n'accepte pas d'opérations concurrentes :
+        # les deux requêtes sont donc enchaînées sur la même connexion.
+        latest_data = (await conn.execute(LATEST_ANALYSIS_SQL, {"symbol": symbol})).first()
+        
+        if latest_data is None:
+            raise HTTPException(status_code=404, detail="Symbol not found or no recent data")
+        
+        price_history = (await conn.execute(PRICE_HISTORY_SQL, {"company_id": latest_data.company_id})).mappings().all()
+    
+    analysis_data = {
+        "symbol": latest_data.symbol,
+        "company_name": latest_data.company_name,
+        "price_history": price_history,
+        "last_trade_date": latest_data.trade_date,
+        "last_price": latest_data.price,
+        "technical_analysis": {
+            "moving_average_signal": latest_data.mm_decision,
+            "bollinger_bands_signal": latest_data.bollinger_decision,
+            "macd_signal": latest_data.macd_decision,
+            "rsi_signal": latest_data.rsi_decision,
+            "stochastic_signal": latest_data.stochastic_decision
+        },
+        "fundamental_analysis": latest_data.fundamental_summaries or "Aucune analyse fondamentale disponible."
+    }
+    
+    return JSONResponse(analysis_data)
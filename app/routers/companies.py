@@ -0,0 +1,40 @@
+# ==============================================================================
+# BRVM API GATEWAY - LISTE DES SOCIÉTÉS
+# ==============================================================================
+
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+from sqlalchemy import text
+from cachetools import TTLCache
+from typing import List
+import asyncio
+
+from app.responses import dumps
+from app.schemas import Company
+
+router = APIRouter()
+
+# --- Requêtes SQL ---
+COMPANIES_SQL = text("SELECT symbol, name FROM companies ORDER BY symbol;")
+
+# --- Cache en mémoire ---
+# La liste des sociétés ne change pratiquement pas en cours de journée :
+# on garde le JSON déjà encodé pour éviter requête et sérialisation.
+COMPANIES_CACHE_TTL = 300
+_companies_cache = TTLCache(maxsize=1, ttl=COMPANIES_CACHE_TTL)
+_companies_lock = asyncio.Lock()
+
+@router.get("/companies/", response_model=List[Company])
+async def get_companies_list(request: Request):
+    body = _companies_cache.get("companies")
+    if body is None:
+        async with _companies_lock:
+            # Une autre requête a pu remplir le cache pendant l'attente du verrou
+            body = _companies_cache.get("companies")
+            if body is None:
+                # Connexion prise dans le pool uniquement en cas d'absence du cache
+                async with request.app.state.engine.connect() as conn:
+                    companies = (await conn.execute(COMPANIES_SQL)).mappings().all()
+                body = dumps(companies)
+                _companies_cache["companies"] = body
+    return Response(content=body, media_type="application/json")
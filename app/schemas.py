@@ -0,0 +1,41 @@
+# ==============================================================================
+# BRVM API GATEWAY - SCHÉMAS DE RÉPONSE
+# ==============================================================================
+#
+# Ces modèles servent uniquement à documenter les réponses (OpenAPI).
+# Convention pour tout endpoint qui déclare un response_model :
+#   - renvoyer directement une Response (JSONResponse ou Response avec le JSON
+#     déjà encodé) : FastAPI saute alors la validation et jsonable_encoder ;
+#   - si un modèle doit filtrer des champs, le construire avec
+#     Modele.model_construct(**row), sans validation, puis renvoyer
+#     JSONResponse(m.model_dump()).
+# Les données viennent de notre propre base : les revalider ne ferait que
+# doubler le coût de sérialisation.
+
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+class Company(BaseModel):
+    symbol: str
+    name: str
+
+class PricePoint(BaseModel):
+    date: date
+    price: float
+
+class TechnicalAnalysis(BaseModel):
+    moving_average_signal: Optional[str] = None
+    bollinger_bands_signal: Optional[str] = None
+    macd_signal: Optional[str] = None
+    rsi_signal: Optional[str] = None
+    stochastic_signal: Optional[str] = None
+
+class FullAnalysis(BaseModel):
+    symbol: str
+    company_name: str
+    price_history: List[PricePoint]
+    last_trade_date: Optional[date] = None
+    last_price: Optional[float] = None
+    technical_analysis: TechnicalAnalysis
+    fundamental_analysis: str
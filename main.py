@@ -2,138 +2,76 @@
 # BRVM API GATEWAY (V0.3 - AJOUT DE L'HISTORIQUE DES PRIX)
 # ==============================================================================
 
-from fastapi import FastAPI, Depends, HTTPException
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, Session
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-import os
-from dotenv import load_dotenv
+import asyncio
+import asyncpg
+import time
 
-# Charger les variables d'environnement (utile pour un test local)
-load_dotenv()
+from app.db import create_engine, get_settings, warm_up_pool
+from app.responses import JSONResponse
+from app.routers import analysis, companies
 
-# --- Configuration de la Base de Données ---
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
+# --- Requêtes SQL ---
+HEALTH_SQL = text("SELECT 1")
 
-# Vérifier que les variables d'environnement sont bien chargées
-if not all([DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME]):
-    print("ERREUR: Une ou plusieurs variables d'environnement de la base de données sont manquantes.")
-    # Dans un contexte de production, vous pourriez vouloir arrêter le script ici
-    # import sys
-    # sys.exit(1)
+# Durée pendant laquelle un SELECT 1 réussi suffit à répondre aux sondes
+HEALTH_CACHE_TTL = 5
 
-DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-
-# Créer le "moteur" de connexion à la base de données
-try:
-    engine = create_engine(DATABASE_URL)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    print("✅ Connexion à la base de données configurée avec succès.")
-except Exception as e:
-    print(f"❌ Erreur lors de la configuration de la connexion à la base de données: {e}")
-    engine = None
-    SessionLocal = None
+# --- Cycle de vie de l'application ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    settings = get_settings()
+    engine = create_engine(settings)
+    try:
+        await warm_up_pool(engine, settings.DB_POOL_SIZE)
+        app.state.engine = engine
+        app.state.db_checked_at = time.monotonic()
+        yield
+    finally:
+        await engine.dispose()
 
 # Initialiser l'application FastAPI
 app = FastAPI(
     title="BRVM Analysis API",
     description="API pour servir les données financières et les analyses de la BRVM.",
-    version="0.3.0"
+    version="0.3.0",
+    default_response_class=JSONResponse,
+    lifespan=lifespan
 )
 
-# --- Dépendance pour la gestion de la session DB ---
-def get_db():
-    if SessionLocal is None:
-        raise HTTPException(status_code=500, detail="La connexion à la base de données n'a pas pu être initialisée.")
-    
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Les réponses /analysis et /companies sont très répétitives (clés, signaux) :
+# la compression réduit fortement le volume transféré. Les petites réponses
+# (health-check) ne sont pas compressées.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+app.include_router(companies.router)
+app.include_router(analysis.router)
 
 # --- Endpoints de l'API ---
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"status": "ok", "message": "Bienvenue sur l'API d'Analyse BRVM !"}
 
 @app.get("/health-check")
-def health_check(db: Session = Depends(get_db)):
-    try:
-        db.execute(text("SELECT 1"))
-        return {"status": "ok", "database_connection": "successful"}
-    except SQLAlchemyError as e:
-        raise HTTPException(status_code=503, detail=f"Database connection error: {e}")
-
-@app.get("/companies/")
-def get_companies_list(db: Session = Depends(get_db)):
-    try:
-        query = text("SELECT symbol, name FROM companies ORDER BY symbol;")
-        result = db.execute(query).fetchall()
-        companies = [{"symbol": row[0], "name": row[1]} for row in result]
-        return companies
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {e}")
-
-@app.get("/analysis/{symbol}")
-def get_full_analysis(symbol: str, db: Session = Depends(get_db)):
-    """
-    Retourne la dernière analyse complète (cours, technique, fondamentale)
-    et l'historique des 50 derniers jours pour un symbole donné.
-    """
-    symbol = symbol.upper()
-    
-    query = text("""
-        WITH ranked_historical_data AS (
-            SELECT *, ROW_NUMBER() OVER(PARTITION BY company_id ORDER BY trade_date DESC) as rn
-            FROM historical_data
-        )
-        SELECT 
-            c.symbol, c.name as company_name,
-            rhd.trade_date, rhd.price,
-            ta.mm_decision, ta.bollinger_decision, ta.macd_decision,
-            ta.rsi_decision, ta.stochastic_decision,
-            (SELECT STRING_AGG(fa.analysis_summary, E'\\n---\\n' ORDER BY fa.report_date DESC) 
-             FROM fundamental_analysis fa 
-             WHERE fa.company_id = c.id) as fundamental_summaries
-        FROM companies c
-        LEFT JOIN ranked_historical_data rhd ON c.id = rhd.company_id
-        LEFT JOIN technical_analysis ta ON rhd.id = ta.historical_data_id
-        WHERE c.symbol = :symbol AND (rhd.rn <= 50 OR rhd.rn IS NULL)
-        ORDER BY rhd.trade_date ASC;
-    """)
-    
-    try:
-        result = db.execute(query, {"symbol": symbol}).fetchall()
-        
-        if not result:
-            raise HTTPException(status_code=404, detail="Symbol not found or no recent data")
-            
-        price_history = [{"date": row.trade_date.strftime('%Y-%m-%d'), "price": row.price} for row in result if row.trade_date and row.price is not None]
-        
-        latest_data = result[-1]
-        
-        analysis_data = {
-            "symbol": latest_data.symbol,
-            "company_name": latest_data.company_name,
-            "price_history": price_history,
-            "last_trade_date": latest_data.trade_date.strftime('%Y-%m-%d') if latest_data.trade_date else None,
-            "last_price": latest_data.price,
-            "technical_analysis": {
-                "moving_average_signal": latest_data.mm_decision,
-                "bollinger_bands_signal": latest_data.bollinger_decision,
-                "macd_signal": latest_data.macd_decision,
-                "rsi_signal": latest_data.rsi_decision,
-                "stochastic_signal": latest_data.stochastic_decision
-            },
-            "fundamental_analysis": latest_data.fundamental_summaries or "Aucune analyse fondamentale disponible."
-        }
-        
-        return analysis_data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred while fetching analysis: {e}")
+async def health_check(request: Request, deep: bool = False):
+    # Les sondes arrivent toutes les quelques secondes sur chaque instance :
+    # la base n'est réinterrogée qu'après HEALTH_CACHE_TTL, ou avec ?deep=1
+    now = time.monotonic()
+    if deep or now - request.app.state.db_checked_at > HEALTH_CACHE_TTL:
+        # Avec asyncpg, un échec d'ouverture de connexion n'est pas enveloppé
+        # dans SQLAlchemyError : refus (OSError), délai dépassé, authentification
+        # (asyncpg.PostgresError). Tous sont rapportés en 503.
+        try:
+            async with request.app.state.engine.connect() as conn:
+                await conn.execute(HEALTH_SQL)
+        except (SQLAlchemyError, asyncpg.PostgresError, OSError, asyncio.TimeoutError):
+            # Une base en échec ne doit plus être déclarée saine par le cache
+            request.app.state.db_checked_at = float("-inf")
+            raise HTTPException(status_code=503, detail="Database connection error")
+        request.app.state.db_checked_at = now
+    return {"status": "ok", "database_connection": "successful"}
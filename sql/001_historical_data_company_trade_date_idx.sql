@@ -0,0 +1,6 @@
+-- Index utilisé par /analysis/{symbol} pour lire les dernières séances
+-- d'une société sans parcourir toute la table historical_data.
+-- CONCURRENTLY : ne bloque pas les écritures ; à lancer hors transaction.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_historical_data_company_trade_date
+    ON historical_data (company_id, trade_date DESC)
+    INCLUDE (price, id);
@@ -0,0 +1,5 @@
+-- Résolution symbole -> société faite en tête de /analysis/{symbol} :
+-- un symbole inconnu doit coûter une simple recherche dans l'index.
+-- Sans effet si une contrainte UNIQUE sur symbol fournit déjà cet index.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_companies_symbol
+    ON companies (symbol);
@@ -0,0 +1,19 @@
+#!/bin/sh
+# ==============================================================================
+# BRVM API GATEWAY - DÉMARRAGE EN PRODUCTION
+# ==============================================================================
+# Plusieurs workers, boucle uvloop et parseur httptools, sans journal d'accès.
+# Le nombre de workers est explicite (et non $(nproc), qui compte les cœurs de
+# l'hôte dans un conteneur) : il est exporté pour que chaque worker vérifie au
+# démarrage que WEB_CONCURRENCY x (DB_POOL_SIZE + DB_MAX_OVERFLOW) tient dans
+# DB_MAX_CONNECTIONS (voir app/db.py).
+
+export WEB_CONCURRENCY="${WEB_CONCURRENCY:-2}"
+
+exec uvicorn main:app \
+    --host 0.0.0.0 \
+    --port "${PORT:-8000}" \
+    --workers "$WEB_CONCURRENCY" \
+    --loop uvloop \
+    --http httptools \
+    --no-access-log
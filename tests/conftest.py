@@ -0,0 +1,16 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    # Pas de lifespan : on n'ouvre aucune vraie connexion. app.state est
+    # restauré par monkeypatch à la fin de chaque test.
+    def _make_client(engine):
+        monkeypatch.setattr(app.state, "engine", engine, raising=False)
+        monkeypatch.setattr(app.state, "db_checked_at", float("-inf"), raising=False)
+        return TestClient(app)
+
+    return _make_client
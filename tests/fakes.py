@@ -0,0 +1,43 @@
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class FakeConnection:
+    """Se comporte comme AsyncConnection : l'échec survient à l'ouverture (__aenter__)."""
+
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def __aenter__(self):
+        if self._engine.error is not None:
+            raise self._engine.error
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, params=None):
+        return FakeResult(self._engine.rows)
+
+
+class FakeEngine:
+    """Moteur factice qui compte les connexions demandées."""
+
+    def __init__(self, error=None, rows=()):
+        self.error = error
+        self.rows = rows
+        self.connect_calls = 0
+
+    def connect(self):
+        self.connect_calls += 1
+        return FakeConnection(self)
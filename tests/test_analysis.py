@@ -0,0 +1,17 @@
+from tests.fakes import FakeEngine
+
+
+def test_unknown_symbol_returns_404(make_client):
+    client = make_client(FakeEngine(rows=[]))
+    response = client.get("/analysis/XXXX")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Symbol not found or no recent data"}
+
+
+def test_malformed_symbol_is_rejected_without_opening_a_connection(make_client):
+    engine = FakeEngine(rows=[])
+    client = make_client(engine)
+    for symbol in ("a", "ABCDEFGHIJK"):
+        response = client.get(f"/analysis/{symbol}")
+        assert response.status_code == 422
+    assert engine.connect_calls == 0
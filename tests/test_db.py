@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from app.db import Settings, warm_up_pool
+from tests.fakes import FakeConnection, FakeEngine
+
+
+class _WarmUpConnection(FakeConnection):
+    async def start(self):
+        self._engine.started += 1
+        if self._engine.started == self._engine.fail_on:
+            raise ConnectionRefusedError(111, "Connect call failed")
+        return self
+
+    async def close(self):
+        self._engine.closed += 1
+
+
+class _WarmUpEngine(FakeEngine):
+    def __init__(self, fail_on):
+        super().__init__()
+        self.fail_on = fail_on
+        self.started = 0
+        self.closed = 0
+
+    def connect(self):
+        self.connect_calls += 1
+        return _WarmUpConnection(self)
+
+
+def test_warm_up_pool_closes_opened_connections_when_one_fails():
+    engine = _WarmUpEngine(fail_on=3)
+    with pytest.raises(ConnectionRefusedError):
+        asyncio.run(warm_up_pool(engine, 5))
+    assert engine.closed == 4
+
+
+def _settings(**overrides):
+    values = dict(DB_USER="u", DB_PASSWORD="p", DB_HOST="h", DB_PORT=5432, DB_NAME="n")
+    values.update(overrides)
+    return Settings(_env_file=None, **values)
+
+
+def test_default_settings_fit_the_connection_budget():
+    settings = _settings()
+    assert settings.WEB_CONCURRENCY * (settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW) <= settings.DB_MAX_CONNECTIONS
+
+
+def test_settings_refuse_pools_larger_than_the_connection_budget():
+    with pytest.raises(ValidationError):
+        _settings(WEB_CONCURRENCY=8)
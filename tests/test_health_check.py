@@ -0,0 +1,36 @@
+import asyncio
+
+import asyncpg
+
+from tests.fakes import FakeEngine
+
+
+def test_health_check_reports_503_when_connection_is_refused(make_client):
+    client = make_client(FakeEngine(error=ConnectionRefusedError(111, "Connect call failed")))
+    response = client.get("/health-check", params={"deep": 1})
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Database connection error"}
+
+
+def test_health_check_reports_503_on_connection_timeout(make_client):
+    client = make_client(FakeEngine(error=asyncio.TimeoutError()))
+    response = client.get("/health-check", params={"deep": 1})
+    assert response.status_code == 503
+
+
+def test_health_check_reports_503_on_authentication_failure(make_client):
+    error = asyncpg.InvalidPasswordError("password authentication failed")
+    client = make_client(FakeEngine(error=error))
+    response = client.get("/health-check", params={"deep": 1})
+    assert response.status_code == 503
+
+
+def test_failed_deep_check_invalidates_cached_success(make_client):
+    engine = FakeEngine()
+    client = make_client(engine)
+    assert client.get("/health-check").status_code == 200
+
+    engine.error = ConnectionRefusedError(111, "Connect call failed")
+    assert client.get("/health-check", params={"deep": 1}).status_code == 503
+    # Sans ?deep=1, la sonde suivante doit revérifier au lieu de servir le cache
+    assert client.get("/health-check").status_code == 503